@@ -1,16 +1,16 @@
 """Sensor platform for thermal_comfort."""
 from asyncio import Lock
-from dataclasses import dataclass
+from bisect import bisect
+from dataclasses import dataclass, replace
 from datetime import timedelta
 from enum import StrEnum
-from functools import wraps
+from functools import lru_cache, wraps
 import logging
 import math
 from typing import Any, Self
 
 import voluptuous as vol
 
-from homeassistant import util
 from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
@@ -62,6 +62,8 @@ CONF_ENABLED_SENSORS = "enabled_sensors"
 CONF_SENSOR_TYPES = "sensor_types"
 CONF_CUSTOM_ICONS = "custom_icons"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MIN_TEMPERATURE_DELTA = "min_temperature_delta"
+CONF_MIN_HUMIDITY_DELTA = "min_humidity_delta"
 
 CONF_TEMPERATURE_SENSOR = "temperature_sensor"
 CONF_HUMIDITY_SENSOR = "humidity_sensor"
@@ -69,6 +71,8 @@ CONF_POLL = "poll"
 # Default values
 POLL_DEFAULT = False
 SCAN_INTERVAL_DEFAULT = 30
+MIN_TEMPERATURE_DELTA_DEFAULT = 0.0
+MIN_HUMIDITY_DELTA_DEFAULT = 0.0
 DISPLAY_PRECISION = 2
 
 
@@ -106,12 +110,12 @@ class SensorType(StrEnum):
     @classmethod
     def from_string(cls, string: str) -> Self:
         """Return the sensor type from string."""
-        if string in list(cls):
+        try:
             return cls(string)
-        else:
+        except ValueError as ex:
             raise ValueError(
                 f"Unknown sensor type: {string}. Please check https://github.com/dolezsa/thermal_comfort/blob/master/documentation/yaml.md#sensor-options for valid options."
-            )
+            ) from ex
 
 
 class DewPointPerception(StrEnum):
@@ -193,6 +197,50 @@ class ThomsDiscomfortPerception(StrEnum):
     DANGEROUS = "dangerous"
 
 
+_DEW_POINT_THRESHOLDS = (10, 13, 16, 18, 21, 24, 26)
+_DEW_POINT_PERCEPTIONS = (
+    DewPointPerception.DRY,
+    DewPointPerception.VERY_COMFORTABLE,
+    DewPointPerception.COMFORTABLE,
+    DewPointPerception.OK_BUT_HUMID,
+    DewPointPerception.SOMEWHAT_UNCOMFORTABLE,
+    DewPointPerception.QUITE_UNCOMFORTABLE,
+    DewPointPerception.EXTREMELY_UNCOMFORTABLE,
+    DewPointPerception.SEVERELY_HIGH,
+)
+
+_SUMMER_SIMMER_THRESHOLDS = (21.1, 25.0, 28.3, 32.8, 37.8, 44.4, 51.7, 65.6)
+_SUMMER_SIMMER_PERCEPTIONS = (
+    SummerSimmerPerception.COOL,
+    SummerSimmerPerception.SLIGHTLY_COOL,
+    SummerSimmerPerception.COMFORTABLE,
+    SummerSimmerPerception.SLIGHTLY_WARM,
+    SummerSimmerPerception.INCREASING_DISCOMFORT,
+    SummerSimmerPerception.EXTREMELY_WARM,
+    SummerSimmerPerception.DANGER_OF_HEATSTROKE,
+    SummerSimmerPerception.EXTREME_DANGER_OF_HEATSTROKE,
+    SummerSimmerPerception.CIRCULATORY_COLLAPSE_IMMINENT,
+)
+
+_RELATIVE_STRAIN_THRESHOLDS = (0.15, 0.25, 0.35, 0.45)
+_RELATIVE_STRAIN_PERCEPTIONS = (
+    RelativeStrainPerception.COMFORTABLE,
+    RelativeStrainPerception.SLIGHT_DISCOMFORT,
+    RelativeStrainPerception.DISCOMFORT,
+    RelativeStrainPerception.SIGNIFICANT_DISCOMFORT,
+    RelativeStrainPerception.EXTREME_DISCOMFORT,
+)
+
+_THOMS_DISCOMFORT_THRESHOLDS = (21, 24, 27, 29, 32)
+_THOMS_DISCOMFORT_PERCEPTIONS = (
+    ThomsDiscomfortPerception.NO_DISCOMFORT,
+    ThomsDiscomfortPerception.LESS_THAN_HALF,
+    ThomsDiscomfortPerception.MORE_THAN_HALF,
+    ThomsDiscomfortPerception.MOST,
+    ThomsDiscomfortPerception.EVERYONE,
+    ThomsDiscomfortPerception.DANGEROUS,
+)
+
 TC_ICONS = {
     SensorType.DEW_POINT: "tc:dew-point",
     SensorType.FROST_POINT: "tc:frost-point",
@@ -310,6 +358,13 @@ SENSOR_TYPES = {
     },
 }
 
+_BASE_DESCRIPTIONS = {
+    sensor_type: SensorEntityDescription(
+        **description, translation_key=sensor_type, has_entity_name=True
+    )
+    for sensor_type, description in SENSOR_TYPES.items()
+}
+
 DEFAULT_SENSOR_TYPES = list(SENSOR_TYPES.keys())
 
 SENSOR_OPTIONS_SCHEMA = vol.Schema(
@@ -318,6 +373,8 @@ SENSOR_OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
         vol.Optional(CONF_CUSTOM_ICONS): cv.boolean,
         vol.Optional(CONF_SENSOR_TYPES): cv.ensure_list,
+        vol.Optional(CONF_MIN_TEMPERATURE_DELTA): cv.positive_float,
+        vol.Optional(CONF_MIN_HUMIDITY_DELTA): cv.positive_float,
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -334,17 +391,189 @@ SENSOR_SCHEMA = vol.Schema(
 ).extend(SENSOR_OPTIONS_SCHEMA.schema)
 
 
+_LOG10_STANDARD_PRESSURE = math.log(1013.246, 10)
+
+
+@lru_cache(maxsize=128)
+def _dew_point(temperature: float, humidity: float) -> float:
+    """Dew Point <http://wahiduddin.net/calc/density_algorithms.htm>.
+
+    Cached so devices sharing the same input sensors compute it only once.
+    """
+    A0 = 373.15 / (273.15 + temperature)
+    SUM = -7.90298 * (A0 - 1)
+    SUM += 5.02808 * math.log(A0, 10)
+    SUM += -1.3816e-7 * (pow(10, (11.344 * (1 - 1 / A0))) - 1)
+    SUM += 8.1328e-3 * (pow(10, (-3.49149 * (A0 - 1))) - 1)
+    SUM += _LOG10_STANDARD_PRESSURE
+    VP = pow(10, SUM - 3) * humidity
+    Td = math.log(VP / 0.61078)
+    Td = (241.88 * Td) / (17.558 - Td)
+    return Td
+
+
+@lru_cache(maxsize=128)
+def _heat_index(temperature: float, humidity: float) -> float:
+    """Heat Index <http://www.wpc.ncep.noaa.gov/html/heatindex_equation.shtml>."""
+    fahrenheit = (temperature * 1.8) + 32.0  # °C to °F
+    hi = 0.5 * (
+        fahrenheit + 61.0 + ((fahrenheit - 68.0) * 1.2) + (humidity * 0.094)
+    )
+
+    if hi > 79:
+        fahrenheit2 = pow(fahrenheit, 2)
+        humidity2 = pow(humidity, 2)
+        hi = -42.379 + 2.04901523 * fahrenheit
+        hi = hi + 10.14333127 * humidity
+        hi = hi + -0.22475541 * fahrenheit * humidity
+        hi = hi + -0.00683783 * fahrenheit2
+        hi = hi + -0.05481717 * humidity2
+        hi = hi + 0.00122874 * fahrenheit2 * humidity
+        hi = hi + 0.00085282 * fahrenheit * humidity2
+        hi = hi + -0.00000199 * fahrenheit2 * humidity2
+
+    if humidity < 13 and fahrenheit >= 80 and fahrenheit <= 112:
+        hi = hi - ((13 - humidity) * 0.25) * math.sqrt(
+            (17 - abs(fahrenheit - 95)) * 0.05882
+        )
+    elif humidity > 85 and fahrenheit >= 80 and fahrenheit <= 87:
+        hi = hi + ((humidity - 85) * 0.1) * ((87 - fahrenheit) * 0.2)
+
+    return (hi - 32.0) / 1.8  # °F to °C
+
+
+def _humidex(temperature: float, dewpoint: float) -> float:
+    """<https://simple.wikipedia.org/wiki/Humidex#Humidex_formula>."""
+    e = 6.11 * math.exp(5417.7530 * ((1 / 273.16) - (1 / (dewpoint + 273.15))))
+    h = (0.5555) * (e - 10.0)
+    return temperature + h
+
+
+@lru_cache(maxsize=128)
+def _absolute_humidity(temperature: float, humidity: float) -> float:
+    """Absolute Humidity <https://carnotcycle.wordpress.com/2012/08/04/how-to-convert-relative-humidity-to-absolute-humidity/>."""
+    abs_temperature = temperature + 273.15
+    abs_humidity = 6.112
+    abs_humidity *= math.exp(
+        (17.67 * temperature) / (243.5 + temperature)
+    )
+    abs_humidity *= humidity
+    abs_humidity *= 2.1674
+    abs_humidity /= abs_temperature
+    return abs_humidity
+
+
+def _frost_point(temperature: float, dewpoint: float) -> float:
+    """Frost Point <https://pon.fr/dzvents-alerte-givre-et-calcul-humidite-absolue/>."""
+    T = temperature + 273.15
+    Td = dewpoint + 273.15
+    return (Td + (2671.02 / ((2954.61 / T) + 2.193665 * math.log(T) - 13.3448)) - T) - 273.15
+
+
+def _relative_strain_index(temperature: float, humidity: float) -> float:
+    """Relative strain index, rounded to two decimals."""
+    vp = 6.112 * pow(10, 7.5 * temperature / (237.7 + temperature))
+    e = humidity * vp / 100
+    return round((temperature - 21) / (58 - e), 2)
+
+
+def _summer_scharlau_index(temperature: float, humidity: float) -> float:
+    """<https://revistadechimie.ro/pdf/16%20RUSANESCU%204%2019.pdf>."""
+    tc = -17.089 * math.log(humidity) + 94.979
+    return tc - temperature
+
+
+def _winter_scharlau_index(temperature: float, humidity: float) -> float:
+    """<https://revistadechimie.ro/pdf/16%20RUSANESCU%204%2019.pdf>."""
+    tc = (0.0003 * humidity) + (0.1497 * humidity) - 7.7133
+    return temperature - tc
+
+
+def _summer_simmer_index(temperature: float, humidity: float) -> float:
+    """<https://www.vcalc.com/wiki/rklarsen/Summer+Simmer+Index>."""
+    fahrenheit = (temperature * 1.8) + 32.0  # °C to °F
+
+    si = (
+        1.98
+        * (fahrenheit - (0.55 - (0.0055 * humidity)) * (fahrenheit - 58.0))
+        - 56.83
+    )
+
+    if fahrenheit < 58:  # Summer Simmer Index is only valid above 58°F
+        si = fahrenheit
+
+    return (si - 32.0) / 1.8  # °F to °C
+
+
+@lru_cache(maxsize=128)
+def _moist_air_enthalpy(temperature: float, humidity: float) -> float:
+    """Calculate the enthalpy of moist air."""
+    patm = 101325  # standard pressure at sea-level
+    c_to_k = 273.15
+
+    # ASHRAE fundamentals 2021 pg 1.5
+    c1 = -5.6745359e03
+    c2 = 6.3925247e00
+    c3 = -9.6778430e-03
+    c4 = 6.2215701e-07
+    c5 = 2.0747825e-09
+    c6 = -9.4840240e-13
+    c7 = 4.1635019e00
+    c8 = -5.8002206e03
+    c9 = 1.3914993e00
+    c10 = -4.8640239e-02
+    c11 = 4.1764768e-05
+    c12 = -1.4452093e-08
+    c13 = 6.5459673e00
+
+    T = temperature + c_to_k
+
+    # calculate saturation vapor pressure for temperature
+    p_ws = (
+        # ASHRAE fundamentals 2021 pg 1.5 eq 5
+        math.exp(c1 / T + c2 + c3 * T + c4 * T**2 + c5 * T**3 + c6 * T**4 + c7 * math.log(T))
+        if T < c_to_k  # noqa: SIM300
+        # ASHRAE fundamentals 2021 pg 1.5 eq 6
+        else math.exp(c8 / T + c9 + c10 * T + c11 * T**2 + c12 * T**3 + c13 * math.log(T))
+    )
+
+    # calculate vapor pressure for RH % (ASHRAE fundamentals 2021 pg 1.9 eq 22)
+    p_w = humidity / 100 * p_ws
+
+    # calculate humidity ratio (ASHRAE fundamentals 2021 pg 1.9 eq 20)
+    W = 0.621945 * p_w / (patm - p_w)
+
+    # calculate enthalpy (ASHRAE fundamentals 2021 pg 1.10 eq 30)
+    return 1.006 * temperature + W * (2501 + 1.86 * temperature)
+
+
+@lru_cache(maxsize=128)
+def _thoms_discomfort_index(temperature: float, humidity: float) -> float:
+    """Calculate Thom's discomfort index."""
+    tw = (
+        temperature
+        * math.atan(0.151977 * pow(humidity + 8.313659, 1 / 2))
+        + math.atan(temperature + humidity)
+        - math.atan(humidity - 1.676331)
+        + pow(0.00391838 * humidity, 3 / 2)
+        * math.atan(0.023101 * humidity)
+        - 4.686035
+    )
+    return 0.5 * tw + 0.5 * temperature
+
+
 def compute_once_lock(sensor_type):
     """Only compute if sensor_type needs update, return just the value otherwise."""
 
     def wrapper(func):
         @wraps(func)
         async def wrapped(self, *args, **kwargs):
-            async with self._compute_states[sensor_type].lock:
-                if self._compute_states[sensor_type].needs_update:
-                    setattr(self, f"_{sensor_type}", await func(self, *args, **kwargs))
-                    self._compute_states[sensor_type].needs_update = False
-                return getattr(self, f"_{sensor_type}", None)
+            compute_state = self._compute_states[sensor_type]
+            async with compute_state.lock:
+                if compute_state.needs_update:
+                    compute_state.value = await func(self, *args, **kwargs)
+                    compute_state.needs_update = False
+                return compute_state.value
 
         return wrapped
 
@@ -380,6 +609,12 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
             scan_interval=device_config.get(
                 CONF_SCAN_INTERVAL, timedelta(seconds=SCAN_INTERVAL_DEFAULT)
             ),
+            min_temperature_delta=device_config.get(
+                CONF_MIN_TEMPERATURE_DELTA, MIN_TEMPERATURE_DELTA_DEFAULT
+            ),
+            min_humidity_delta=device_config.get(
+                CONF_MIN_HUMIDITY_DELTA, MIN_HUMIDITY_DELTA_DEFAULT
+            ),
         )
 
         sensors += [
@@ -469,15 +704,12 @@ class SensorThermalComfort(SensorEntity):
         """Initialize the sensor."""
         self._device = device
         self._sensor_type = sensor_type
-        entity_description = SENSOR_TYPES[sensor_type]
-        entity_description["translation_key"] = sensor_type
-        entity_description["has_entity_name"] = True
+        self._compute = getattr(device, sensor_type)
+        changes = {"entity_registry_enabled_default": is_enabled_default}
         if not is_config_entry:
             if self._device.name is not None:
-                entity_description["has_entity_name"] = False
-                entity_description["name"] = (
-                    f"{self._device.name} {self._sensor_type.to_name()}"
-                )
+                changes["has_entity_name"] = False
+                changes["name"] = f"{self._device.name} {self._sensor_type.to_name()}"
             if sensor_type in [SensorType.DEW_POINT_PERCEPTION, SensorType.SUMMER_SIMMER_INDEX, SensorType.SUMMER_SIMMER_PERCEPTION]:
                 registry = er.async_get(self._device.hass)
                 match sensor_type:
@@ -491,10 +723,9 @@ class SensorThermalComfort(SensorEntity):
                 if entity_id is not None:
                     registry.async_update_entity(entity_id, new_unique_id=id_generator(self._device.unique_id, sensor_type))
         if custom_icons:
-            if entity_description["key"] in TC_ICONS:
-                entity_description["icon"] = TC_ICONS[entity_description["key"]]
-        entity_description["entity_registry_enabled_default"] = is_enabled_default
-        self.entity_description = SensorEntityDescription(**entity_description)
+            if sensor_type in TC_ICONS:
+                changes["icon"] = TC_ICONS[sensor_type]
+        self.entity_description = replace(_BASE_DESCRIPTIONS[sensor_type], **changes)
         self._icon_template = icon_template
         self._entity_picture_template = entity_picture_template
         self._attr_native_value = None
@@ -519,14 +750,21 @@ class SensorThermalComfort(SensorEntity):
         self._device.sensors.append(self)
         if self._icon_template is not None:
             self._icon_template.hass = self.hass
+            if self._icon_template.is_static:
+                # a static template never changes, render it once
+                self._attr_icon = self._icon_template.async_render()
+                self._icon_template = None
         if self._entity_picture_template is not None:
             self._entity_picture_template.hass = self.hass
+            if self._entity_picture_template.is_static:
+                self._attr_entity_picture = self._entity_picture_template.async_render()
+                self._entity_picture_template = None
         if self._device.compute_states[self._sensor_type].needs_update:
             self.async_schedule_update_ha_state(True)
 
     async def async_update(self):
         """Update the state of the sensor."""
-        value = await getattr(self._device, self._sensor_type)()
+        value = await self._compute()
         if value is None:  # can happen during startup
             return
 
@@ -570,17 +808,34 @@ class SensorThermalComfort(SensorEntity):
                     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComputeState:
     """Thermal Comfort Calculation State."""
 
     needs_update: bool = False
     lock: Lock = None
+    value: Any = None
 
 
 class DeviceThermalComfort:
     """Representation of a Thermal Comfort Sensor."""
 
+    __slots__ = (
+        "hass",
+        "_unique_id",
+        "_device_info",
+        "extra_state_attributes",
+        "_temperature_entity",
+        "_humidity_entity",
+        "_temperature",
+        "_humidity",
+        "_should_poll",
+        "_min_temperature_delta",
+        "_min_humidity_delta",
+        "sensors",
+        "_compute_states",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -590,6 +845,8 @@ class DeviceThermalComfort:
         humidity_entity: str,
         should_poll: bool,
         scan_interval: timedelta,
+        min_temperature_delta: float = MIN_TEMPERATURE_DELTA_DEFAULT,
+        min_humidity_delta: float = MIN_HUMIDITY_DELTA_DEFAULT,
     ):
         """Initialize the sensor."""
         self.hass = hass
@@ -606,6 +863,8 @@ class DeviceThermalComfort:
         self._temperature = None
         self._humidity = None
         self._should_poll = should_poll
+        self._min_temperature_delta = min_temperature_delta
+        self._min_humidity_delta = min_humidity_delta
         self.sensors = []
         self._compute_states = {
             sensor_type: ComputeState(lock=Lock())
@@ -613,11 +872,9 @@ class DeviceThermalComfort:
         }
 
         async_track_state_change_event(
-            self.hass, self._temperature_entity, self.temperature_state_listener
-        )
-
-        async_track_state_change_event(
-            self.hass, self._humidity_entity, self.humidity_state_listener
+            self.hass,
+            [self._temperature_entity, self._humidity_entity],
+            self.state_listener,
         )
 
         hass.async_create_task(
@@ -643,33 +900,58 @@ class DeviceThermalComfort:
             await async_get_custom_components(self.hass)
         )[DOMAIN].version.string
 
-    async def temperature_state_listener(self, event):
-        """Handle temperature device state changes."""
-        await self._new_temperature_state(event.data.get("new_state"))
+    async def state_listener(self, event):
+        """Handle temperature and humidity device state changes."""
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        if (
+            new_state is not None
+            and old_state is not None
+            and new_state.state == old_state.state
+            and new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            == old_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        ):
+            # attribute-only change, nothing to recalculate
+            return
+        entity_id = event.data["entity_id"]
+        if entity_id == self._temperature_entity:
+            await self._new_temperature_state(new_state)
+        if entity_id == self._humidity_entity:
+            await self._new_humidity_state(new_state)
 
     async def _new_temperature_state(self, state):
-        if _is_valid_state(state):
+        temp = _valid_state_value(state)
+        if temp is not None:
             hass = self.hass
             unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT, hass.config.units.temperature_unit)
-            temp = util.convert(state.state, float)
             # convert to celsius if necessary
             temperature = TemperatureConverter.convert(temp, unit, UnitOfTemperature.CELSIUS)
             if -89.2 <= temperature <= 56.7:
+                if self._temperature is not None and (
+                    (
+                        temperature == self._temperature
+                        and temp == self.extra_state_attributes.get(ATTR_TEMPERATURE)
+                    )
+                    or abs(temperature - self._temperature) < self._min_temperature_delta
+                ):
+                    # unchanged input value or below the configured delta
+                    return
                 self.extra_state_attributes[ATTR_TEMPERATURE] = temp
                 self._temperature = temperature
                 await self.async_update()
         else:
             _LOGGER.info("Temperature has an invalid value: %s. Can't calculate new states.", state)
 
-    async def humidity_state_listener(self, event):
-        """Handle humidity device state changes."""
-        await self._new_humidity_state(event.data.get("new_state"))
-
     async def _new_humidity_state(self, state):
-        if _is_valid_state(state):
-            humidity = float(state.state)
+        humidity = _valid_state_value(state)
+        if humidity is not None:
             if 0 < humidity <= 100:
-                self._humidity = float(state.state)
+                if self._humidity is not None and (
+                    humidity == self._humidity
+                    or abs(humidity - self._humidity) < self._min_humidity_delta
+                ):
+                    return
+                self._humidity = humidity
                 self.extra_state_attributes[ATTR_HUMIDITY] = self._humidity
                 await self.async_update()
         else:
@@ -678,53 +960,17 @@ class DeviceThermalComfort:
     @compute_once_lock(SensorType.DEW_POINT)
     async def dew_point(self) -> float:
         """Dew Point <http://wahiduddin.net/calc/density_algorithms.htm>."""
-        A0 = 373.15 / (273.15 + self._temperature)
-        SUM = -7.90298 * (A0 - 1)
-        SUM += 5.02808 * math.log(A0, 10)
-        SUM += -1.3816e-7 * (pow(10, (11.344 * (1 - 1 / A0))) - 1)
-        SUM += 8.1328e-3 * (pow(10, (-3.49149 * (A0 - 1))) - 1)
-        SUM += math.log(1013.246, 10)
-        VP = pow(10, SUM - 3) * self._humidity
-        Td = math.log(VP / 0.61078)
-        Td = (241.88 * Td) / (17.558 - Td)
-        return Td
+        return _dew_point(self._temperature, self._humidity)
 
     @compute_once_lock(SensorType.HEAT_INDEX)
     async def heat_index(self) -> float:
         """Heat Index <http://www.wpc.ncep.noaa.gov/html/heatindex_equation.shtml>."""
-        fahrenheit = TemperatureConverter.convert(
-            self._temperature, UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT
-        )
-        hi = 0.5 * (
-            fahrenheit + 61.0 + ((fahrenheit - 68.0) * 1.2) + (self._humidity * 0.094)
-        )
-
-        if hi > 79:
-            hi = -42.379 + 2.04901523 * fahrenheit
-            hi = hi + 10.14333127 * self._humidity
-            hi = hi + -0.22475541 * fahrenheit * self._humidity
-            hi = hi + -0.00683783 * pow(fahrenheit, 2)
-            hi = hi + -0.05481717 * pow(self._humidity, 2)
-            hi = hi + 0.00122874 * pow(fahrenheit, 2) * self._humidity
-            hi = hi + 0.00085282 * fahrenheit * pow(self._humidity, 2)
-            hi = hi + -0.00000199 * pow(fahrenheit, 2) * pow(self._humidity, 2)
-
-        if self._humidity < 13 and fahrenheit >= 80 and fahrenheit <= 112:
-            hi = hi - ((13 - self._humidity) * 0.25) * math.sqrt(
-                (17 - abs(fahrenheit - 95)) * 0.05882
-            )
-        elif self._humidity > 85 and fahrenheit >= 80 and fahrenheit <= 87:
-            hi = hi + ((self._humidity - 85) * 0.1) * ((87 - fahrenheit) * 0.2)
-
-        return TemperatureConverter.convert(hi, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS)
+        return _heat_index(self._temperature, self._humidity)
 
     @compute_once_lock(SensorType.HUMIDEX)
     async def humidex(self) -> int:
         """<https://simple.wikipedia.org/wiki/Humidex#Humidex_formula>."""
-        dewpoint = await self.dew_point()
-        e = 6.11 * math.exp(5417.7530 * ((1 / 273.16) - (1 / (dewpoint + 273.15))))
-        h = (0.5555) * (e - 10.0)
-        return self._temperature + h
+        return _humidex(self._temperature, await self.dew_point())
 
     @compute_once_lock(SensorType.HUMIDEX_PERCEPTION)
     async def humidex_perception(self) -> (HumidexPerception, dict):
@@ -749,45 +995,19 @@ class DeviceThermalComfort:
     async def dew_point_perception(self) -> (DewPointPerception, dict):
         """Dew Point <https://en.wikipedia.org/wiki/Dew_point>."""
         dewpoint = await self.dew_point()
-        if dewpoint < 10:
-            perception = DewPointPerception.DRY
-        elif dewpoint < 13:
-            perception = DewPointPerception.VERY_COMFORTABLE
-        elif dewpoint < 16:
-            perception = DewPointPerception.COMFORTABLE
-        elif dewpoint < 18:
-            perception = DewPointPerception.OK_BUT_HUMID
-        elif dewpoint < 21:
-            perception = DewPointPerception.SOMEWHAT_UNCOMFORTABLE
-        elif dewpoint < 24:
-            perception = DewPointPerception.QUITE_UNCOMFORTABLE
-        elif dewpoint < 26:
-            perception = DewPointPerception.EXTREMELY_UNCOMFORTABLE
-        else:
-            perception = DewPointPerception.SEVERELY_HIGH
+        perception = _DEW_POINT_PERCEPTIONS[bisect(_DEW_POINT_THRESHOLDS, dewpoint)]
 
         return perception, {ATTR_DEW_POINT: dewpoint}
 
     @compute_once_lock(SensorType.ABSOLUTE_HUMIDITY)
     async def absolute_humidity(self) -> float:
         """Absolute Humidity <https://carnotcycle.wordpress.com/2012/08/04/how-to-convert-relative-humidity-to-absolute-humidity/>."""
-        abs_temperature = self._temperature + 273.15
-        abs_humidity = 6.112
-        abs_humidity *= math.exp(
-            (17.67 * self._temperature) / (243.5 + self._temperature)
-        )
-        abs_humidity *= self._humidity
-        abs_humidity *= 2.1674
-        abs_humidity /= abs_temperature
-        return abs_humidity
+        return _absolute_humidity(self._temperature, self._humidity)
 
     @compute_once_lock(SensorType.FROST_POINT)
     async def frost_point(self) -> float:
         """Frost Point <https://pon.fr/dzvents-alerte-givre-et-calcul-humidite-absolue/>."""
-        dewpoint = await self.dew_point()
-        T = self._temperature + 273.15
-        Td = dewpoint + 273.15
-        return (Td + (2671.02 / ((2954.61 / T) + 2.193665 * math.log(T) - 13.3448)) - T) - 273.15
+        return _frost_point(self._temperature, await self.dew_point())
 
     @compute_once_lock(SensorType.FROST_RISK)
     async def frost_risk(self) -> (FrostRisk, dict):
@@ -814,31 +1034,21 @@ class DeviceThermalComfort:
     @compute_once_lock(SensorType.RELATIVE_STRAIN_PERCEPTION)
     async def relative_strain_perception(self) -> (RelativeStrainPerception, dict):
         """Relative strain perception."""
-
-        vp = 6.112 * pow(10, 7.5 * self._temperature / (237.7 + self._temperature))
-        e = self._humidity * vp / 100
-        rsi = round((self._temperature - 21) / (58 - e), 2)
+        rsi = _relative_strain_index(self._temperature, self._humidity)
 
         if self._temperature < 26 or self._temperature > 35:
             perception = RelativeStrainPerception.OUTSIDE_CALCULABLE_RANGE
-        elif rsi >= 0.45:
-            perception = RelativeStrainPerception.EXTREME_DISCOMFORT
-        elif rsi >= 0.35:
-            perception = RelativeStrainPerception.SIGNIFICANT_DISCOMFORT
-        elif rsi >= 0.25:
-            perception = RelativeStrainPerception.DISCOMFORT
-        elif rsi >= 0.15:
-            perception = RelativeStrainPerception.SLIGHT_DISCOMFORT
         else:
-            perception = RelativeStrainPerception.COMFORTABLE
+            perception = _RELATIVE_STRAIN_PERCEPTIONS[
+                bisect(_RELATIVE_STRAIN_THRESHOLDS, rsi)
+            ]
 
         return perception, {ATTR_RELATIVE_STRAIN_INDEX: rsi}
 
     @compute_once_lock(SensorType.SUMMER_SCHARLAU_PERCEPTION)
     async def summer_scharlau_perception(self) -> (ScharlauPerception, dict):
         """<https://revistadechimie.ro/pdf/16%20RUSANESCU%204%2019.pdf>."""
-        tc = -17.089 * math.log(self._humidity) + 94.979
-        ise = tc - self._temperature
+        ise = _summer_scharlau_index(self._temperature, self._humidity)
 
         if self._temperature < 17 or self._temperature > 39 or self._humidity < 30:
             perception = ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
@@ -856,8 +1066,7 @@ class DeviceThermalComfort:
     @compute_once_lock(SensorType.WINTER_SCHARLAU_PERCEPTION)
     async def winter_scharlau_perception(self) -> (ScharlauPerception, dict):
         """<https://revistadechimie.ro/pdf/16%20RUSANESCU%204%2019.pdf>."""
-        tc = (0.0003 * self._humidity) + (0.1497 * self._humidity) - 7.7133
-        ish = self._temperature - tc
+        ish = _winter_scharlau_index(self._temperature, self._humidity)
         if self._temperature < -5 or self._temperature > 6 or self._humidity < 40:
             perception = ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
         elif ish <= -3:
@@ -874,113 +1083,31 @@ class DeviceThermalComfort:
     @compute_once_lock(SensorType.SUMMER_SIMMER_INDEX)
     async def summer_simmer_index(self) -> float:
         """<https://www.vcalc.com/wiki/rklarsen/Summer+Simmer+Index>."""
-        fahrenheit = TemperatureConverter.convert(
-            self._temperature, UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT
-        )
-
-        si = (
-            1.98
-            * (fahrenheit - (0.55 - (0.0055 * self._humidity)) * (fahrenheit - 58.0))
-            - 56.83
-        )
-
-        if fahrenheit < 58:  # Summer Simmer Index is only valid above 58°F
-            si = fahrenheit
-
-        return TemperatureConverter.convert(si, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS)
+        return _summer_simmer_index(self._temperature, self._humidity)
 
     @compute_once_lock(SensorType.SUMMER_SIMMER_PERCEPTION)
     async def summer_simmer_perception(self) -> (SummerSimmerPerception, dict):
         """<http://summersimmer.com/default.asp>."""
         si = await self.summer_simmer_index()
-        if si < 21.1:
-            summer_simmer_perception = SummerSimmerPerception.COOL
-        elif si < 25.0:
-            summer_simmer_perception = SummerSimmerPerception.SLIGHTLY_COOL
-        elif si < 28.3:
-            summer_simmer_perception = SummerSimmerPerception.COMFORTABLE
-        elif si < 32.8:
-            summer_simmer_perception = SummerSimmerPerception.SLIGHTLY_WARM
-        elif si < 37.8:
-            summer_simmer_perception = SummerSimmerPerception.INCREASING_DISCOMFORT
-        elif si < 44.4:
-            summer_simmer_perception = SummerSimmerPerception.EXTREMELY_WARM
-        elif si < 51.7:
-            summer_simmer_perception = SummerSimmerPerception.DANGER_OF_HEATSTROKE
-        elif si < 65.6:
-            summer_simmer_perception = SummerSimmerPerception.EXTREME_DANGER_OF_HEATSTROKE
-        else:
-            summer_simmer_perception = SummerSimmerPerception.CIRCULATORY_COLLAPSE_IMMINENT
+        summer_simmer_perception = _SUMMER_SIMMER_PERCEPTIONS[
+            bisect(_SUMMER_SIMMER_THRESHOLDS, si)
+        ]
 
         return summer_simmer_perception, {ATTR_SUMMER_SIMMER_INDEX: si}
 
     @compute_once_lock(SensorType.MOIST_AIR_ENTHALPY)
     async def moist_air_enthalpy(self) -> float:
         """Calculate the enthalpy of moist air."""
-        patm = 101325  # standard pressure at sea-level
-        c_to_k = 273.15
-
-        # ASHRAE fundamentals 2021 pg 1.5
-        c1 = -5.6745359e03
-        c2 = 6.3925247e00
-        c3 = -9.6778430e-03
-        c4 = 6.2215701e-07
-        c5 = 2.0747825e-09
-        c6 = -9.4840240e-13
-        c7 = 4.1635019e00
-        c8 = -5.8002206e03
-        c9 = 1.3914993e00
-        c10 = -4.8640239e-02
-        c11 = 4.1764768e-05
-        c12 = -1.4452093e-08
-        c13 = 6.5459673e00
-
-        T = self._temperature + c_to_k
-
-        # calculate saturation vapor pressure for temperature
-        p_ws = (
-            # ASHRAE fundamentals 2021 pg 1.5 eq 5
-            math.exp(c1 / T + c2 + c3 * T + c4 * T**2 + c5 * T**3 + c6 * T**4 + c7 * math.log(T))
-            if T < c_to_k  # noqa: SIM300
-            # ASHRAE fundamentals 2021 pg 1.5 eq 6
-            else math.exp(c8 / T + c9 + c10 * T + c11 * T**2 + c12 * T**3 + c13 * math.log(T))
-        )
-
-        # calculate vapor pressure for RH % (ASHRAE fundamentals 2021 pg 1.9 eq 22)
-        p_w = self._humidity / 100 * p_ws
-
-        # calculate humidity ratio (ASHRAE fundamentals 2021 pg 1.9 eq 20)
-        W = 0.621945 * p_w / (patm - p_w)
-
-        # calculate enthalpy (ASHRAE fundamentals 2021 pg 1.10 eq 30)
-        return 1.006 * self._temperature + W * (2501 + 1.86 * self._temperature)
+        return _moist_air_enthalpy(self._temperature, self._humidity)
 
     @compute_once_lock(SensorType.THOMS_DISCOMFORT_PERCEPTION)
     async def thoms_discomfort_perception(self) -> (ThomsDiscomfortPerception, dict):
         """Calculate Thom's discomfort index and perception."""
-        tw = (
-            self._temperature
-            * math.atan(0.151977 * pow(self._humidity + 8.313659, 1 / 2))
-            + math.atan(self._temperature + self._humidity)
-            - math.atan(self._humidity - 1.676331)
-            + pow(0.00391838 * self._humidity, 3 / 2)
-            * math.atan(0.023101 * self._humidity)
-            - 4.686035
-        )
-        tdi = 0.5 * tw + 0.5 * self._temperature
-
-        if tdi >= 32:
-            perception = ThomsDiscomfortPerception.DANGEROUS
-        elif tdi >= 29:
-            perception = ThomsDiscomfortPerception.EVERYONE
-        elif tdi >= 27:
-            perception = ThomsDiscomfortPerception.MOST
-        elif tdi >= 24:
-            perception = ThomsDiscomfortPerception.MORE_THAN_HALF
-        elif tdi >= 21:
-            perception = ThomsDiscomfortPerception.LESS_THAN_HALF
-        else:
-            perception = ThomsDiscomfortPerception.NO_DISCOMFORT
+        tdi = _thoms_discomfort_index(self._temperature, self._humidity)
+
+        perception = _THOMS_DISCOMFORT_PERCEPTIONS[
+            bisect(_THOMS_DISCOMFORT_THRESHOLDS, tdi)
+        ]
 
         return perception, {ATTR_THOMS_DISCOMFORT_INDEX: round(tdi, 2)}
 
@@ -1018,11 +1145,16 @@ class DeviceThermalComfort:
         return self._device_info["name"]
 
 
-def _is_valid_state(state) -> bool:
-    if state is not None:
-        if state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                return not math.isnan(float(state.state))
-            except ValueError:
-                pass
-    return False
+_INVALID_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
+
+
+def _valid_state_value(state) -> float | None:
+    """Return the numeric value of a state, or None if it is not usable."""
+    if state is not None and state.state not in _INVALID_STATES:
+        try:
+            value = float(state.state)
+        except ValueError:
+            return None
+        if not math.isnan(value):
+            return value
+    return None
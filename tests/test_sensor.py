@@ -15,6 +15,8 @@ from custom_components.thermal_comfort.sensor import (
     ATTR_THOMS_DISCOMFORT_INDEX,
     ATTR_WINTER_SCHARLAU_INDEX,
     CONF_CUSTOM_ICONS,
+    CONF_MIN_HUMIDITY_DELTA,
+    CONF_MIN_TEMPERATURE_DELTA,
     CONF_SENSOR_TYPES,
     DEFAULT_SENSOR_TYPES,
     DewPointPerception,
@@ -29,7 +31,11 @@ from custom_components.thermal_comfort.sensor import (
 )
 from homeassistant.components.command_line.const import DOMAIN as COMMAND_LINE_DOMAIN
 from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
-from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    UnitOfTemperature,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
@@ -55,54 +61,116 @@ HUMIDITY_TEST_SENSOR = {
     },
 }
 
+NAN_TEMPERATURE_TEST_SENSOR = {
+    PLATFORM_DOMAIN: {
+        "command": "echo 0",
+        "name": "test_temperature_sensor",
+        "value_template": "{{ NaN | float }}",
+    },
+}
+
+NAN_HUMIDITY_TEST_SENSOR = {
+    PLATFORM_DOMAIN: {
+        "command": "echo 0",
+        "name": "test_humidity_sensor",
+        "value_template": "{{ NaN | float }}",
+    },
+}
+
+THERMAL_COMFORT_TEST_SENSOR = {
+    "name": "test_thermal_comfort",
+    "temperature_sensor": "sensor.test_temperature_sensor",
+    "humidity_sensor": "sensor.test_humidity_sensor",
+    "unique_id": "unique_thermal_comfort_id",
+}
+
+DEFAULT_TEST_DOMAINS = [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)]
+
+
+def make_test_config(
+    platform_config,
+    temperature_sensor=TEMPERATURE_TEST_SENSOR,
+    humidity_sensor=HUMIDITY_TEST_SENSOR,
+) -> dict:
+    """Build a command_line inputs plus thermal_comfort platform config."""
+    return {
+        COMMAND_LINE_DOMAIN: [temperature_sensor, humidity_sensor],
+        DOMAIN: {PLATFORM_DOMAIN: platform_config},
+    }
+
+
+DEFAULT_TEST_CONFIG = make_test_config(THERMAL_COMFORT_TEST_SENSOR)
+
 DEFAULT_TEST_SENSORS = [
     "domains, config",
-    [
-        (
-            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
-            {
-                COMMAND_LINE_DOMAIN: [
-                    TEMPERATURE_TEST_SENSOR,
-                    HUMIDITY_TEST_SENSOR,
-                ],
-                DOMAIN: {
-                    PLATFORM_DOMAIN: {
-                        "name": "test_thermal_comfort",
-                        "temperature_sensor": "sensor.test_temperature_sensor",
-                        "humidity_sensor": "sensor.test_humidity_sensor",
-                        "unique_id": "unique_thermal_comfort_id",
-                    },
-                },
-            },
-        ),
-    ],
+    [(DEFAULT_TEST_DOMAINS, DEFAULT_TEST_CONFIG)],
 ]
 
 LEN_DEFAULT_SENSORS = len(DEFAULT_SENSOR_TYPES)
 
 
-def get_sensor(hass, sensor_type: SensorType) -> str:
+def get_sensor_entity_ids(name: str) -> dict:
+    """Return the entity id of every sensor type for a device name."""
+    return {sensor_type: f"{name}_{sensor_type}" for sensor_type in SensorType}
+
+
+SENSOR_ENTITY_IDS = get_sensor_entity_ids(TEST_NAME)
+
+
+def get_sensor(
+    hass, sensor_type: SensorType, entity_ids: dict = SENSOR_ENTITY_IDS
+) -> str:
     """Get test sensor id."""
-    return hass.states.get(f"{TEST_NAME}_{sensor_type}")
+    return hass.states.get(entity_ids[sensor_type])
+
+
+@pytest.fixture
+def domains():
+    """Return the domains set up by start_ha unless a test parametrizes its own."""
+    return DEFAULT_TEST_DOMAINS
+
+
+@pytest.fixture
+def config():
+    """Return the configuration used by start_ha unless a test parametrizes its own."""
+    return DEFAULT_TEST_CONFIG
+
+
+async def set_inputs(hass, temperature: str, humidity: str) -> None:
+    """Set both test input sensors and wait for the update once."""
+    hass.states.async_set("sensor.test_temperature_sensor", temperature)
+    hass.states.async_set("sensor.test_humidity_sensor", humidity)
+    await hass.async_block_till_done()
+
+
+def get_sensor_snapshot(hass) -> dict:
+    """Return state and last update time of every default sensor."""
+    snapshot = {}
+    for sensor_type in DEFAULT_SENSOR_TYPES:
+        state = get_sensor(hass, sensor_type)
+        snapshot[sensor_type] = (state.state, state.last_updated)
+    return snapshot
+
+
+def assert_all_recomputed(before: dict, after: dict) -> None:
+    """Assert every default sensor wrote a new state since before."""
+    for sensor_type in DEFAULT_SENSOR_TYPES:
+        assert after[sensor_type][1] != before[sensor_type][1]
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_config(hass, start_ha):
     """Test basic config."""
     assert len(hass.states.async_all(PLATFORM_DOMAIN)) == LEN_DEFAULT_SENSORS + 2
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_properties(hass, start_ha):
     """Test if properties are set up correctly."""
     for sensor_type in DEFAULT_SENSOR_TYPES:
-        assert ATTR_TEMPERATURE in get_sensor(hass, sensor_type).attributes
-        assert ATTR_HUMIDITY in get_sensor(hass, sensor_type).attributes
-        assert get_sensor(hass, sensor_type).attributes[ATTR_TEMPERATURE] == 25.0
-        assert get_sensor(hass, sensor_type).attributes[ATTR_HUMIDITY] == 50.0
+        attributes = get_sensor(hass, sensor_type).attributes
+        assert attributes[ATTR_TEMPERATURE] == 25.0
+        assert attributes[ATTR_HUMIDITY] == 50.0
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_absolutehumidity(hass, start_ha):
     """Test if absolute humidity is calculted correctly."""
     assert get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY) is not None
@@ -117,7 +185,6 @@ async def test_absolutehumidity(hass, start_ha):
     assert get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state == "3.20436993419671"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_heatindex(hass, start_ha):
     """Test if heat index is calculated correctly."""
     assert get_sensor(hass, SensorType.HEAT_INDEX) is not None
@@ -131,14 +198,10 @@ async def test_heatindex(hass, start_ha):
     await hass.async_block_till_done()
     assert get_sensor(hass, SensorType.HEAT_INDEX).state == "13.2083333333333"
 
-    hass.states.async_set("sensor.test_humidity_sensor", "12.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "28.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="28.0", humidity="12.0")
     assert get_sensor(hass, SensorType.HEAT_INDEX).state == "26.5451914107181"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_humidex(hass, start_ha):
     """Test if humidex is calculated correctly."""
     assert get_sensor(hass, SensorType.HUMIDEX) is not None
@@ -152,14 +215,10 @@ async def test_humidex(hass, start_ha):
     await hass.async_block_till_done()
     assert get_sensor(hass, SensorType.HUMIDEX).state == "11.8124622223777"
 
-    hass.states.async_set("sensor.test_humidity_sensor", "12.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "28.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="28.0", humidity="12.0")
     assert get_sensor(hass, SensorType.HUMIDEX).state == "24.9644772432578"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_humidex_perception(hass, start_ha):
     """Test if humidex perception is calculated correctly."""
     assert get_sensor(hass, SensorType.HUMIDEX_PERCEPTION) is not None
@@ -168,18 +227,14 @@ async def test_humidex_perception(hass, start_ha):
         == HumidexPerception.COMFORTABLE
     )
 
-    hass.states.async_set("sensor.test_temperature_sensor", "26.1")
-    hass.states.async_set("sensor.test_humidity_sensor", "50.03")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="26.1", humidity="50.03")
     assert get_sensor(hass, SensorType.HUMIDEX).state == "30.0035339225107"
     assert (
         get_sensor(hass, SensorType.HUMIDEX_PERCEPTION).state
         == HumidexPerception.NOTICABLE_DISCOMFORT
     )
 
-    hass.states.async_set("sensor.test_temperature_sensor", "29.06")
-    hass.states.async_set("sensor.test_humidity_sensor", "51.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="29.06", humidity="51.0")
     assert get_sensor(hass, SensorType.HUMIDEX).state == "35.0014998241678"
     assert (
         get_sensor(hass, SensorType.HUMIDEX_PERCEPTION).state
@@ -194,9 +249,7 @@ async def test_humidex_perception(hass, start_ha):
         == HumidexPerception.DANGEROUS_DISCOMFORT
     )
 
-    hass.states.async_set("sensor.test_temperature_sensor", "35.95")
-    hass.states.async_set("sensor.test_humidity_sensor", "70")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="35.95", humidity="70")
     assert get_sensor(hass, SensorType.HUMIDEX).state == "54.0070687092117"
     assert (
         get_sensor(hass, SensorType.HUMIDEX_PERCEPTION).state
@@ -204,7 +257,6 @@ async def test_humidex_perception(hass, start_ha):
     )
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_dew_point(hass, start_ha):
     """Test if dew point is calculated correctly."""
     assert get_sensor(hass, SensorType.DEW_POINT) is not None
@@ -219,7 +271,6 @@ async def test_dew_point(hass, start_ha):
     assert get_sensor(hass, SensorType.DEW_POINT).state == "-4.86267786296348"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_dew_point_perception(hass, start_ha):
     """Test if dew point perception is calculated correctly."""
     hass.states.async_set("sensor.test_temperature_sensor", "20.77")
@@ -263,30 +314,21 @@ async def test_dew_point_perception(hass, start_ha):
         == DewPointPerception.SOMEWHAT_UNCOMFORTABLE
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "79.6")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "26.00")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="26.00", humidity="79.6")
     assert get_sensor(hass, SensorType.DEW_POINT).state == "22.2150631359531"
     assert (
         get_sensor(hass, SensorType.DEW_POINT_PERCEPTION).state
         == DewPointPerception.QUITE_UNCOMFORTABLE
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "85.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "26.85")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="26.85", humidity="85.0")
     assert get_sensor(hass, SensorType.DEW_POINT).state == "24.1299575993527"
     assert (
         get_sensor(hass, SensorType.DEW_POINT_PERCEPTION).state
         == DewPointPerception.EXTREMELY_UNCOMFORTABLE
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "95.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "26.856")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="26.856", humidity="95.0")
     assert get_sensor(hass, SensorType.DEW_POINT).state == "26.0021323711165"
     assert (
         get_sensor(hass, SensorType.DEW_POINT_PERCEPTION).state
@@ -294,7 +336,6 @@ async def test_dew_point_perception(hass, start_ha):
     )
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_frost_point(hass, start_ha):
     """Test if frost point is calculated correctly."""
     assert get_sensor(hass, SensorType.FROST_POINT) is not None
@@ -309,45 +350,29 @@ async def test_frost_point(hass, start_ha):
     assert get_sensor(hass, SensorType.FROST_POINT).state == "-6.8126182274957"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_frost_risk(hass, start_ha):
     """Test if frost risk is calculated correctly."""
-    assert get_sensor(hass, SensorType.FROST_RISK) is not None
-    assert get_sensor(hass, SensorType.FROST_RISK).state == FrostRisk.NONE
-    assert (
-        get_sensor(hass, SensorType.FROST_RISK).attributes[ATTR_FROST_POINT]
-        == 10.421850849560201
-    )
+    sensor = get_sensor(hass, SensorType.FROST_RISK)
+    assert sensor is not None
+    assert sensor.state == FrostRisk.NONE
+    assert sensor.attributes[ATTR_FROST_POINT] == 10.421850849560201
 
-    hass.states.async_set("sensor.test_temperature_sensor", "0")
-    hass.states.async_set("sensor.test_humidity_sensor", "57.7")
-    await hass.async_block_till_done()
-    assert get_sensor(hass, SensorType.FROST_RISK).state == FrostRisk.LOW
-    assert (
-        get_sensor(hass, SensorType.FROST_RISK).attributes[ATTR_FROST_POINT]
-        == -7.346077951913912
-    )
+    await set_inputs(hass, temperature="0", humidity="57.7")
+    sensor = get_sensor(hass, SensorType.FROST_RISK)
+    assert sensor.state == FrostRisk.LOW
+    assert sensor.attributes[ATTR_FROST_POINT] == -7.346077951913912
 
-    hass.states.async_set("sensor.test_temperature_sensor", "4.0")
-    hass.states.async_set("sensor.test_humidity_sensor", "80.65")
-    await hass.async_block_till_done()
-    assert get_sensor(hass, SensorType.FROST_RISK).state == FrostRisk.MEDIUM
-    assert (
-        get_sensor(hass, SensorType.FROST_RISK).attributes[ATTR_FROST_POINT]
-        == 0.4945717077964673
-    )
+    await set_inputs(hass, temperature="4.0", humidity="80.65")
+    sensor = get_sensor(hass, SensorType.FROST_RISK)
+    assert sensor.state == FrostRisk.MEDIUM
+    assert sensor.attributes[ATTR_FROST_POINT] == 0.4945717077964673
 
-    hass.states.async_set("sensor.test_temperature_sensor", "1.0")
-    hass.states.async_set("sensor.test_humidity_sensor", "90.00")
-    await hass.async_block_till_done()
-    assert get_sensor(hass, SensorType.FROST_RISK).state == FrostRisk.HIGH
-    assert (
-        get_sensor(hass, SensorType.FROST_RISK).attributes[ATTR_FROST_POINT]
-        == -0.5732593367861227
-    )
+    await set_inputs(hass, temperature="1.0", humidity="90.00")
+    sensor = get_sensor(hass, SensorType.FROST_RISK)
+    assert sensor.state == FrostRisk.HIGH
+    assert sensor.attributes[ATTR_FROST_POINT] == -0.5732593367861227
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_summer_simmer_index(hass, start_ha):
     """Test if simmer index is calculated correctly."""
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX) is not None
@@ -357,14 +382,10 @@ async def test_summer_simmer_index(hass, start_ha):
     await hass.async_block_till_done()
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "15.2475"
 
-    hass.states.async_set("sensor.test_humidity_sensor", "35.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="25.0", humidity="35.0")
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "27.87825"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_summer_simmer_perception(hass, start_ha):
     """Test if simmer zone is calculated correctly."""
     hass.states.async_set("sensor.test_temperature_sensor", "20.77")
@@ -408,40 +429,28 @@ async def test_summer_simmer_perception(hass, start_ha):
         == SummerSimmerPerception.SLIGHTLY_WARM
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "79.6")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "26.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="26.0", humidity="79.6")
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "34.762864"
     assert (
         get_sensor(hass, SensorType.SUMMER_SIMMER_PERCEPTION).state
         == SummerSimmerPerception.INCREASING_DISCOMFORT
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "85.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "26.85")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="26.85", humidity="85.0")
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "36.9865525"
     assert (
         get_sensor(hass, SensorType.SUMMER_SIMMER_PERCEPTION).state
         == SummerSimmerPerception.INCREASING_DISCOMFORT
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "80.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "29.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="29.0", humidity="80.0")
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "40.0998"
     assert (
         get_sensor(hass, SensorType.SUMMER_SIMMER_PERCEPTION).state
         == SummerSimmerPerception.EXTREMELY_WARM
     )
 
-    hass.states.async_set("sensor.test_humidity_sensor", "45.0")
-    await hass.async_block_till_done()
-    hass.states.async_set("sensor.test_temperature_sensor", "40.0")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="40.0", humidity="45.0")
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "49.7435"
     assert (
         get_sensor(hass, SensorType.SUMMER_SIMMER_PERCEPTION).state
@@ -449,189 +458,82 @@ async def test_summer_simmer_perception(hass, start_ha):
     )
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_moist_air_enthalpy(hass, start_ha):
     """Test if moist air enthalpy is calculated correctly."""
     assert get_sensor(hass, SensorType.MOIST_AIR_ENTHALPY) is not None
     assert get_sensor(hass, SensorType.MOIST_AIR_ENTHALPY).state == "50.3219588021847"
 
-    hass.states.async_set("sensor.test_temperature_sensor", "20.77")
-    hass.states.async_set("sensor.test_humidity_sensor", "60.82")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="20.77", humidity="60.82")
     assert get_sensor(hass, SensorType.MOIST_AIR_ENTHALPY) is not None
     assert get_sensor(hass, SensorType.MOIST_AIR_ENTHALPY).state == "44.4961886780509"
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_relative_strain_perception(hass, start_ha):
     """Test if relative strain perception is calculated correctly."""
-    assert get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION) is not None
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.09
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.OUTSIDE_CALCULABLE_RANGE
-    )
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor is not None
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.09
+    assert sensor.state == RelativeStrainPerception.OUTSIDE_CALCULABLE_RANGE
 
     hass.states.async_set("sensor.test_temperature_sensor", "35.01")
     await hass.async_block_till_done()
-    assert get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION) is not None
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.47
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.OUTSIDE_CALCULABLE_RANGE
-    )
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor is not None
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.47
+    assert sensor.state == RelativeStrainPerception.OUTSIDE_CALCULABLE_RANGE
 
-    hass.states.async_set("sensor.test_temperature_sensor", "26.00")
-    hass.states.async_set("sensor.test_humidity_sensor", "70.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.14
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.COMFORTABLE
-    )
+    await set_inputs(hass, temperature="26.00", humidity="70.00")
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.14
+    assert sensor.state == RelativeStrainPerception.COMFORTABLE
 
-    hass.states.async_set("sensor.test_temperature_sensor", "27.00")
-    hass.states.async_set("sensor.test_humidity_sensor", "50.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.15
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.SLIGHT_DISCOMFORT
-    )
+    await set_inputs(hass, temperature="27.00", humidity="50.00")
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.15
+    assert sensor.state == RelativeStrainPerception.SLIGHT_DISCOMFORT
 
-    hass.states.async_set("sensor.test_temperature_sensor", "31.00")
-    hass.states.async_set("sensor.test_humidity_sensor", "38.40")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.25
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.DISCOMFORT
-    )
+    await set_inputs(hass, temperature="31.00", humidity="38.40")
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.25
+    assert sensor.state == RelativeStrainPerception.DISCOMFORT
 
-    hass.states.async_set("sensor.test_temperature_sensor", "32.00")
-    hass.states.async_set("sensor.test_humidity_sensor", "56.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.35
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.SIGNIFICANT_DISCOMFORT
-    )
+    await set_inputs(hass, temperature="32.00", humidity="56.00")
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.35
+    assert sensor.state == RelativeStrainPerception.SIGNIFICANT_DISCOMFORT
 
-    hass.states.async_set("sensor.test_temperature_sensor", "31.50")
-    hass.states.async_set("sensor.test_humidity_sensor", "75.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes[
-            ATTR_RELATIVE_STRAIN_INDEX
-        ]
-        == 0.45
-    )
-    assert (
-        get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).state
-        == RelativeStrainPerception.EXTREME_DISCOMFORT
-    )
+    await set_inputs(hass, temperature="31.50", humidity="75.00")
+    sensor = get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION)
+    assert sensor.attributes[ATTR_RELATIVE_STRAIN_INDEX] == 0.45
+    assert sensor.state == RelativeStrainPerception.EXTREME_DISCOMFORT
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_summer_scharlau_perception(hass, start_ha):
     """Test if summer scharlau perception is calculated correctly."""
-    assert get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION) is not None
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_SUMMER_SCHARLAU_INDEX
-        ]
-        == 3.13
-    )
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.COMFORTABLE
-    )
-
-    hass.states.async_set("sensor.test_temperature_sensor", "36.291")
-    hass.states.async_set("sensor.test_humidity_sensor", "31.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_SUMMER_SCHARLAU_INDEX
-        ]
-        == 0
-    )
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.COMFORTABLE
-    )
-
-    hass.states.async_set("sensor.test_temperature_sensor", "36.31")
-    hass.states.async_set("sensor.test_humidity_sensor", "31.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_SUMMER_SCHARLAU_INDEX
-        ]
-        == -0.01
-    )
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.SLIGHTLY_UNCOMFORTABLE
-    )
-
-    hass.states.async_set("sensor.test_temperature_sensor", "36.23")
-    hass.states.async_set("sensor.test_humidity_sensor", "33.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_SUMMER_SCHARLAU_INDEX
-        ]
-        == -1.0
-    )
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.MODERATELY_UNCOMFORTABLE
-    )
-
-    hass.states.async_set("sensor.test_temperature_sensor", "35.82")
-    hass.states.async_set("sensor.test_humidity_sensor", "38.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_SUMMER_SCHARLAU_INDEX
-        ]
-        == -3.0
-    )
-    assert (
-        get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.HIGHLY_UNCOMFORTABLE
-    )
+    sensor = get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION)
+    assert sensor is not None
+    assert sensor.attributes[ATTR_SUMMER_SCHARLAU_INDEX] == 3.13
+    assert sensor.state == ScharlauPerception.COMFORTABLE
+
+    await set_inputs(hass, temperature="36.291", humidity="31.00")
+    sensor = get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_SUMMER_SCHARLAU_INDEX] == 0
+    assert sensor.state == ScharlauPerception.COMFORTABLE
+
+    await set_inputs(hass, temperature="36.31", humidity="31.00")
+    sensor = get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_SUMMER_SCHARLAU_INDEX] == -0.01
+    assert sensor.state == ScharlauPerception.SLIGHTLY_UNCOMFORTABLE
+
+    await set_inputs(hass, temperature="36.23", humidity="33.00")
+    sensor = get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_SUMMER_SCHARLAU_INDEX] == -1.0
+    assert sensor.state == ScharlauPerception.MODERATELY_UNCOMFORTABLE
+
+    await set_inputs(hass, temperature="35.82", humidity="38.00")
+    sensor = get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_SUMMER_SCHARLAU_INDEX] == -3.0
+    assert sensor.state == ScharlauPerception.HIGHLY_UNCOMFORTABLE
 
     hass.states.async_set("sensor.test_temperature_sensor", "39.01")
     await hass.async_block_till_done()
@@ -647,84 +549,40 @@ async def test_summer_scharlau_perception(hass, start_ha):
         == ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
     )
 
-    hass.states.async_set("sensor.test_temperature_sensor", "30.00")
-    hass.states.async_set("sensor.test_humidity_sensor", "29.99")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="30.00", humidity="29.99")
     assert (
         get_sensor(hass, SensorType.SUMMER_SCHARLAU_PERCEPTION).state
         == ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
     )
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_winter_scharlau_perception(hass, start_ha):
     """Test if winter scharlau perception is calculated correctly."""
-    assert get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION) is not None
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_WINTER_SCHARLAU_INDEX
-        ]
-        == 25.21
-    )
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
-    )
+    sensor = get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION)
+    assert sensor is not None
+    assert sensor.attributes[ATTR_WINTER_SCHARLAU_INDEX] == 25.21
+    assert sensor.state == ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
 
-    hass.states.async_set("sensor.test_temperature_sensor", "3.54")
-    hass.states.async_set("sensor.test_humidity_sensor", "75.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_WINTER_SCHARLAU_INDEX
-        ]
-        == 0
-    )
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.COMFORTABLE
-    )
+    await set_inputs(hass, temperature="3.54", humidity="75.00")
+    sensor = get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_WINTER_SCHARLAU_INDEX] == 0
+    assert sensor.state == ScharlauPerception.COMFORTABLE
 
     hass.states.async_set("sensor.test_temperature_sensor", "3.53")
     await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_WINTER_SCHARLAU_INDEX
-        ]
-        == -0.01
-    )
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.SLIGHTLY_UNCOMFORTABLE
-    )
+    sensor = get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_WINTER_SCHARLAU_INDEX] == -0.01
+    assert sensor.state == ScharlauPerception.SLIGHTLY_UNCOMFORTABLE
 
-    hass.states.async_set("sensor.test_temperature_sensor", "-0.06")
-    hass.states.async_set("sensor.test_humidity_sensor", "71.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_WINTER_SCHARLAU_INDEX
-        ]
-        == -3.0
-    )
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.MODERATELY_UNCOMFORTABLE
-    )
+    await set_inputs(hass, temperature="-0.06", humidity="71.00")
+    sensor = get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_WINTER_SCHARLAU_INDEX] == -3.0
+    assert sensor.state == ScharlauPerception.MODERATELY_UNCOMFORTABLE
 
-    hass.states.async_set("sensor.test_temperature_sensor", "-0.07")
-    hass.states.async_set("sensor.test_humidity_sensor", "71.00")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).attributes[
-            ATTR_WINTER_SCHARLAU_INDEX
-        ]
-        == -3.01
-    )
-    assert (
-        get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).state
-        == ScharlauPerception.HIGHLY_UNCOMFORTABLE
-    )
+    await set_inputs(hass, temperature="-0.07", humidity="71.00")
+    sensor = get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION)
+    assert sensor.attributes[ATTR_WINTER_SCHARLAU_INDEX] == -3.01
+    assert sensor.state == ScharlauPerception.HIGHLY_UNCOMFORTABLE
 
     hass.states.async_set("sensor.test_temperature_sensor", "-6.01")
     await hass.async_block_till_done()
@@ -740,134 +598,73 @@ async def test_winter_scharlau_perception(hass, start_ha):
         == ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
     )
 
-    hass.states.async_set("sensor.test_temperature_sensor", "6.00")
-    hass.states.async_set("sensor.test_humidity_sensor", "39.00")
-    await hass.async_block_till_done()
+    await set_inputs(hass, temperature="6.00", humidity="39.00")
     assert (
         get_sensor(hass, SensorType.WINTER_SCHARLAU_PERCEPTION).state
         == ScharlauPerception.OUTSIDE_CALCULABLE_RANGE
     )
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_thoms_discomfort_perception(hass, start_ha):
     """Test if thoms discomfort perception is calculated correctly."""
-    assert get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION) is not None
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).attributes[
-            ATTR_THOMS_DISCOMFORT_INDEX
-        ]
-        == 20.94
-    )
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).state
-        == ThomsDiscomfortPerception.NO_DISCOMFORT
-    )
+    sensor = get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION)
+    assert sensor is not None
+    assert sensor.attributes[ATTR_THOMS_DISCOMFORT_INDEX] == 20.94
+    assert sensor.state == ThomsDiscomfortPerception.NO_DISCOMFORT
 
-    hass.states.async_set("sensor.test_temperature_sensor", "25.06")
-    hass.states.async_set("sensor.test_humidity_sensor", "50.05")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).attributes[
-            ATTR_THOMS_DISCOMFORT_INDEX
-        ]
-        == 21
-    )
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).state
-        == ThomsDiscomfortPerception.LESS_THAN_HALF
-    )
+    await set_inputs(hass, temperature="25.06", humidity="50.05")
+    sensor = get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION)
+    assert sensor.attributes[ATTR_THOMS_DISCOMFORT_INDEX] == 21
+    assert sensor.state == ThomsDiscomfortPerception.LESS_THAN_HALF
 
-    hass.states.async_set("sensor.test_temperature_sensor", "27.50")
-    hass.states.async_set("sensor.test_humidity_sensor", "63.80")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).attributes[
-            ATTR_THOMS_DISCOMFORT_INDEX
-        ]
-        == 24
-    )
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).state
-        == ThomsDiscomfortPerception.MORE_THAN_HALF
-    )
+    await set_inputs(hass, temperature="27.50", humidity="63.80")
+    sensor = get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION)
+    assert sensor.attributes[ATTR_THOMS_DISCOMFORT_INDEX] == 24
+    assert sensor.state == ThomsDiscomfortPerception.MORE_THAN_HALF
 
-    hass.states.async_set("sensor.test_temperature_sensor", "30.70")
-    hass.states.async_set("sensor.test_humidity_sensor", "62.70")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).attributes[
-            ATTR_THOMS_DISCOMFORT_INDEX
-        ]
-        == 27
-    )
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).state
-        == ThomsDiscomfortPerception.MOST
-    )
+    await set_inputs(hass, temperature="30.70", humidity="62.70")
+    sensor = get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION)
+    assert sensor.attributes[ATTR_THOMS_DISCOMFORT_INDEX] == 27
+    assert sensor.state == ThomsDiscomfortPerception.MOST
 
-    hass.states.async_set("sensor.test_temperature_sensor", "32.30")
-    hass.states.async_set("sensor.test_humidity_sensor", "71.50")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).attributes[
-            ATTR_THOMS_DISCOMFORT_INDEX
-        ]
-        == 29
-    )
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).state
-        == ThomsDiscomfortPerception.EVERYONE
-    )
+    await set_inputs(hass, temperature="32.30", humidity="71.50")
+    sensor = get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION)
+    assert sensor.attributes[ATTR_THOMS_DISCOMFORT_INDEX] == 29
+    assert sensor.state == ThomsDiscomfortPerception.EVERYONE
 
-    hass.states.async_set("sensor.test_temperature_sensor", "35.20")
-    hass.states.async_set("sensor.test_humidity_sensor", "75.10")
-    await hass.async_block_till_done()
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).attributes[
-            ATTR_THOMS_DISCOMFORT_INDEX
-        ]
-        == 32
-    )
-    assert (
-        get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION).state
-        == ThomsDiscomfortPerception.DANGEROUS
-    )
+    await set_inputs(hass, temperature="35.20", humidity="75.10")
+    sensor = get_sensor(hass, SensorType.THOMS_DISCOMFORT_PERCEPTION)
+    assert sensor.attributes[ATTR_THOMS_DISCOMFORT_INDEX] == 32
+    assert sensor.state == ThomsDiscomfortPerception.DANGEROUS
 
 
 @pytest.mark.parametrize(
     "domains, config",
     [
         (
-            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
-            {
-                COMMAND_LINE_DOMAIN: [
-                    TEMPERATURE_TEST_SENSOR,
-                    HUMIDITY_TEST_SENSOR,
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                [
+                    {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "unique_id": "unique",
+                    },
+                    {
+                        "name": "test_thermal_comfort_not_unique1",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "unique_id": "not-so-unique-anymore",
+                    },
+                    {
+                        "name": "test_thermal_comfort_not_unique2",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "unique_id": "not-so-unique-anymore",
+                    },
                 ],
-                DOMAIN: {
-                    PLATFORM_DOMAIN: [
-                        {
-                            "name": "test_thermal_comfort",
-                            "temperature_sensor": "sensor.test_temperature_sensor",
-                            "humidity_sensor": "sensor.test_humidity_sensor",
-                            "unique_id": "unique",
-                        },
-                        {
-                            "name": "test_thermal_comfort_not_unique1",
-                            "temperature_sensor": "sensor.test_temperature_sensor",
-                            "humidity_sensor": "sensor.test_humidity_sensor",
-                            "unique_id": "not-so-unique-anymore",
-                        },
-                        {
-                            "name": "test_thermal_comfort_not_unique2",
-                            "temperature_sensor": "sensor.test_temperature_sensor",
-                            "humidity_sensor": "sensor.test_humidity_sensor",
-                            "unique_id": "not-so-unique-anymore",
-                        },
-                    ]
-                },
-            },
+            ),
         ),
     ],
 )
@@ -879,55 +676,43 @@ async def test_unique_id(hass, start_ha):
 
     assert len(ent_reg.entities) == 2 * LEN_DEFAULT_SENSORS
 
-    for sensor_type in DEFAULT_SENSOR_TYPES:
-        assert (
-            ent_reg.async_get_entity_id(
-                PLATFORM_DOMAIN, "thermal_comfort", f"unique{sensor_type}"
-            )
-            is not None
-        )
-        assert (
-            ent_reg.async_get_entity_id(
-                PLATFORM_DOMAIN,
-                "thermal_comfort",
-                f"not-so-unique-anymore{sensor_type}",
-            )
-            is not None
-        )
+    unique_ids = [
+        f"{prefix}{sensor_type}"
+        for prefix in ("unique", "not-so-unique-anymore")
+        for sensor_type in DEFAULT_SENSOR_TYPES
+    ]
+    missing = [
+        unique_id
+        for unique_id in unique_ids
+        if ent_reg.async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, unique_id) is None
+    ]
+    assert not missing
 
 
 @pytest.mark.parametrize(
     "domains, config",
     [
         (
-            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
-            {
-                COMMAND_LINE_DOMAIN: [
-                    TEMPERATURE_TEST_SENSOR,
-                    HUMIDITY_TEST_SENSOR,
-                ],
-                DOMAIN: {
-                    PLATFORM_DOMAIN: {
-                        "name": "test_thermal_comfort",
-                        "temperature_sensor": "sensor.test_temperature_sensor",
-                        "humidity_sensor": "sensor.test_humidity_sensor",
-                        "icon_template": "mdi:thermometer",
-                        "unique_id": "unique_thermal_comfort_id",
-                    },
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                {
+                    **THERMAL_COMFORT_TEST_SENSOR,
+                    "icon_template": "mdi:thermometer",
                 },
-            },
+            ),
         ),
     ],
 )
 async def test_valid_icon_template(hass, start_ha):
     """Test if icon template is working as expected."""
     assert len(hass.states.async_all(PLATFORM_DOMAIN)) == LEN_DEFAULT_SENSORS + 2
+    assert (
+        get_sensor(hass, SensorType.DEW_POINT).attributes["icon"] == "mdi:thermometer"
+    )
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def test_zero_degree_celcius(hass, start_ha):
     """Test if zero degree celsius does not cause any errors."""
-    assert len(hass.states.async_all(PLATFORM_DOMAIN)) == LEN_DEFAULT_SENSORS + 2
     hass.states.async_set("sensor.test_temperature_sensor", "0")
     await hass.async_block_till_done()
     assert get_sensor(hass, SensorType.DEW_POINT) is not None
@@ -936,29 +721,167 @@ async def test_zero_degree_celcius(hass, start_ha):
     assert get_sensor(hass, SensorType.SUMMER_SIMMER_INDEX).state == "0.0"
 
 
+async def test_unchanged_value(hass, start_ha):
+    """Test if an input value that only changed its formatting is ignored."""
+    before = get_sensor_snapshot(hass)
+    await set_inputs(hass, "25", "50")
+    assert get_sensor_snapshot(hass) == before
+
+
+async def test_unit_change_same_value(hass, start_ha):
+    """Test if a unit change to the same celsius value updates the input."""
+    before = {
+        sensor_type: get_sensor(hass, sensor_type).state
+        for sensor_type in DEFAULT_SENSOR_TYPES
+    }
+    for value, unit in (
+        ("77.0", UnitOfTemperature.FAHRENHEIT),
+        ("25.0", UnitOfTemperature.CELSIUS),
+    ):
+        hass.states.async_set(
+            "sensor.test_temperature_sensor",
+            value,
+            {ATTR_UNIT_OF_MEASUREMENT: unit},
+        )
+        await hass.async_block_till_done()
+        for sensor_type in DEFAULT_SENSOR_TYPES:
+            state = get_sensor(hass, sensor_type)
+            assert state.state == before[sensor_type]
+            assert state.attributes[ATTR_TEMPERATURE] == float(value)
+
+
+async def test_attribute_only_change(hass, start_ha):
+    """Test if an input attribute change without new state is ignored."""
+    before = get_sensor_snapshot(hass)
+    hass.states.async_set(
+        "sensor.test_temperature_sensor", "25.0", {"battery_level": 80}
+    )
+    await hass.async_block_till_done()
+    assert get_sensor_snapshot(hass) == before
+
+
+async def test_unit_only_change(hass, start_ha):
+    """Test if a changed input unit with the same state is recalculated."""
+    before = get_sensor_snapshot(hass)
+    hass.states.async_set(
+        "sensor.test_temperature_sensor",
+        "25.0",
+        {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+    )
+    await hass.async_block_till_done()
+    assert get_sensor_snapshot(hass) == before
+
+    hass.states.async_set(
+        "sensor.test_temperature_sensor",
+        "25.0",
+        {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.FAHRENHEIT},
+    )
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.DEW_POINT).state == "-12.7934395686778"
+
+    hass.states.async_set(
+        "sensor.test_temperature_sensor",
+        "25.0",
+        {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+    )
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.DEW_POINT).state == "13.8753224672013"
+
+
 @pytest.mark.parametrize(
     "domains, config",
     [
         (
-            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
-            {
-                COMMAND_LINE_DOMAIN: [
-                    TEMPERATURE_TEST_SENSOR,
-                    HUMIDITY_TEST_SENSOR,
-                ],
-                DOMAIN: {
-                    PLATFORM_DOMAIN: {
-                        "name": "test_thermal_comfort",
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                {
+                    **THERMAL_COMFORT_TEST_SENSOR,
+                    CONF_MIN_TEMPERATURE_DELTA: 1.0,
+                    CONF_MIN_HUMIDITY_DELTA: 5.0,
+                },
+            ),
+        ),
+    ],
+)
+async def test_min_delta(hass, start_ha):
+    """Test if changes below the configured deltas are ignored."""
+    before = get_sensor_snapshot(hass)
+
+    hass.states.async_set("sensor.test_temperature_sensor", "25.5")
+    await hass.async_block_till_done()
+    assert get_sensor_snapshot(hass) == before
+
+    hass.states.async_set("sensor.test_temperature_sensor", "26.0")
+    await hass.async_block_till_done()
+    after = get_sensor_snapshot(hass)
+    assert_all_recomputed(before, after)
+    assert after[SensorType.DEW_POINT][0] != before[SensorType.DEW_POINT][0]
+
+    before = after
+    hass.states.async_set("sensor.test_humidity_sensor", "54.0")
+    await hass.async_block_till_done()
+    assert get_sensor_snapshot(hass) == before
+
+    hass.states.async_set("sensor.test_humidity_sensor", "55.0")
+    await hass.async_block_till_done()
+    after = get_sensor_snapshot(hass)
+    assert_all_recomputed(before, after)
+    assert after[SensorType.DEW_POINT][0] != before[SensorType.DEW_POINT][0]
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                [
+                    {
+                        **THERMAL_COMFORT_TEST_SENSOR,
+                        CONF_CUSTOM_ICONS: True,
+                    },
+                    {
+                        "name": "test_thermal_comfort2",
                         "temperature_sensor": "sensor.test_temperature_sensor",
                         "humidity_sensor": "sensor.test_humidity_sensor",
-                        "sensor_types": [
-                            SensorType.ABSOLUTE_HUMIDITY,
-                            SensorType.DEW_POINT,
-                        ],
-                        "unique_id": "unique_thermal_comfort_id",
+                        "unique_id": "unique_thermal_comfort_id2",
                     },
+                ],
+            ),
+        ),
+    ],
+)
+async def test_device_options_not_shared(hass, start_ha):
+    """Test if icons and names of one device do not leak to another."""
+    assert get_sensor(hass, SensorType.DEW_POINT).attributes["icon"] == "tc:dew-point"
+    entity_ids = get_sensor_entity_ids(f"{TEST_NAME}2")
+    for sensor_type in DEFAULT_SENSOR_TYPES:
+        sensor = get_sensor(hass, sensor_type, entity_ids)
+        assert (
+            sensor.attributes["friendly_name"]
+            == f"test_thermal_comfort2 {sensor_type.to_name()}"
+        )
+    sensor = get_sensor(hass, SensorType.DEW_POINT, entity_ids)
+    assert sensor.attributes["icon"] == "mdi:thermometer-water"
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                {
+                    "name": "test_thermal_comfort",
+                    "temperature_sensor": "sensor.test_temperature_sensor",
+                    "humidity_sensor": "sensor.test_humidity_sensor",
+                    "sensor_types": [
+                        SensorType.ABSOLUTE_HUMIDITY,
+                        SensorType.DEW_POINT,
+                    ],
+                    "unique_id": "unique_thermal_comfort_id",
                 },
-            },
+            ),
         ),
     ],
 )
@@ -977,33 +900,12 @@ async def get_sensor_types(hass, start_ha):
     "domains, config",
     [
         (
-            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
-            {
-                COMMAND_LINE_DOMAIN: [
-                    {
-                        PLATFORM_DOMAIN: {
-                            "command": "echo 0",
-                            "name": "test_temperature_sensor",
-                            "value_template": "{{ NaN | float }}",
-                        },
-                    },
-                    {
-                        PLATFORM_DOMAIN: {
-                            "command": "echo 0",
-                            "name": "test_humidity_sensor",
-                            "value_template": "{{ NaN | float }}",
-                        },
-                    },
-                ],
-                DOMAIN: {
-                    PLATFORM_DOMAIN: {
-                        "name": "test_thermal_comfort",
-                        "temperature_sensor": "sensor.test_temperature_sensor",
-                        "humidity_sensor": "sensor.test_humidity_sensor",
-                        "unique_id": "unique_thermal_comfort_id",
-                    },
-                },
-            },
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                THERMAL_COMFORT_TEST_SENSOR,
+                NAN_TEMPERATURE_TEST_SENSOR,
+                NAN_HUMIDITY_TEST_SENSOR,
+            ),
         ),
     ],
 )
@@ -1019,32 +921,16 @@ async def get_sensor_is_nan(hass, start_ha):
     "domains, config",
     [
         (
-            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
-            {
-                COMMAND_LINE_DOMAIN: [
-                    {
-                        PLATFORM_DOMAIN: {
-                            "command": "echo 0",
-                            "name": "test_temperature_sensor",
-                            "value_template": "{{ NaN | float }}",
-                        }
-                    },
-                    {
-                        PLATFORM_DOMAIN: {
-                            "command": "echo 0",
-                            "name": "test_humidity_sensor",
-                            "value_template": "{{ NaN | float }}",
-                        }
-                    },
-                ],
-                DOMAIN: {
-                    PLATFORM_DOMAIN: {
-                        "name": "test_thermal_comfort",
-                        "temperature_sensor": "sensor.test_temperature_sensor",
-                        "humidity_sensor": "sensor.test_humidity_sensor",
-                    },
+            DEFAULT_TEST_DOMAINS,
+            make_test_config(
+                {
+                    "name": "test_thermal_comfort",
+                    "temperature_sensor": "sensor.test_temperature_sensor",
+                    "humidity_sensor": "sensor.test_humidity_sensor",
                 },
-            },
+                NAN_TEMPERATURE_TEST_SENSOR,
+                NAN_HUMIDITY_TEST_SENSOR,
+            ),
         ),
     ],
 )
@@ -1056,7 +942,6 @@ async def get_sensor_unknown(hass, start_ha):
         assert ATTR_HUMIDITY not in get_sensor(hass, sensor_type).attributes
 
 
-@pytest.mark.parametrize(*DEFAULT_TEST_SENSORS)
 async def get_sensor_unavailable(hass, start_ha):
     """Test handling unavailable sensors."""
     assert len(hass.states.async_all(PLATFORM_DOMAIN)) == LEN_DEFAULT_SENSORS + 2